@@ -22,6 +22,30 @@ from .shap_components import *
 from .decisiontree_components import *
 
 
+def _construct_components(composite, explainer, spec, **kwargs):
+    """instantiates the (attribute, component class name) pairs in spec as
+    attributes on composite, with names numbered composite.name+"0", +"1", etc."""
+    for i, (attr, cls_name) in enumerate(spec):
+        cls = globals()[cls_name]
+        setattr(composite, attr, cls(explainer, name=composite.name+str(i), **kwargs))
+
+
+def _row(*cols, **kwargs):
+    """Builds a dbc.Row around cols, collapsing the common case of a single
+    full-width column into a plain html.Div: a Row/Col pair around a single
+    unsized column adds no grid behavior, just two extra components for the
+    client to render."""
+    if len(cols) == 1:
+        col = cols[0]
+        if (isinstance(col, dbc.Col)
+            and getattr(col, "md", None) is None
+            and getattr(col, "width", None) is None):
+            return html.Div(col.children, **kwargs)
+        if not isinstance(col, dbc.Col):
+            return html.Div([col], **kwargs)
+    return dbc.Row(list(cols), **kwargs)
+
+
 class ImportancesComposite(ExplainerComponent):
     def __init__(self, explainer, title="Feature Importances", name=None,
                     hide_importances=False,
@@ -47,18 +71,34 @@ class ImportancesComposite(ExplainerComponent):
         self.importances = ImportancesComponent(
                 explainer, name=self.name+"0", hide_selector=hide_selector, **kwargs)
 
-    def layout(self):
+    def _build_layout(self):
+        importances_layout = self.importances.layout()
         return html.Div([
-            dbc.Row([
+            _row(
                 make_hideable(
                     dbc.Col([
-                        self.importances.layout(),
+                        importances_layout,
                     ]), hide=self.hide_importances),
-            ], style=dict(margin=25))
+                style=dict(margin=25))
         ])
 
 
 class ClassifierModelStatsComposite(ExplainerComponent):
+
+    # all subcomponents share the same construction parameters, so they
+    # are declared as a spec table and instantiated in a single loop
+    _SPEC = (
+        ('summary', 'ClassifierModelSummaryComponent'),
+        ('precision', 'PrecisionComponent'),
+        ('confusionmatrix', 'ConfusionMatrixComponent'),
+        ('cumulative_precision', 'CumulativePrecisionComponent'),
+        ('liftcurve', 'LiftCurveComponent'),
+        ('classification', 'ClassificationComponent'),
+        ('rocauc', 'RocAucComponent'),
+        ('prauc', 'PrAucComponent'),
+        ('cutoffpercentile', 'CutoffPercentileComponent'),
+    )
+
     def __init__(self, explainer, title="Classification Stats", name=None,
                     hide_title=True, hide_selector=True, 
                     hide_globalcutoff=False,
@@ -102,57 +142,49 @@ class ClassifierModelStatsComposite(ExplainerComponent):
         """
         super().__init__(explainer, title, name)
 
-        self.summary = ClassifierModelSummaryComponent(explainer, name=self.name+"0", 
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.precision = PrecisionComponent(explainer, name=self.name+"1",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.confusionmatrix = ConfusionMatrixComponent(explainer, name=self.name+"2",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.cumulative_precision = CumulativePrecisionComponent(explainer, name=self.name+"3",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.liftcurve = LiftCurveComponent(explainer, name=self.name+"4",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.classification = ClassificationComponent(explainer, name=self.name+"5",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.rocauc = RocAucComponent(explainer, name=self.name+"6",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-        self.prauc = PrAucComponent(explainer, name=self.name+"7",
-                hide_selector=hide_selector, pos_label=pos_label, **kwargs)
-
-        self.cutoffpercentile = CutoffPercentileComponent(explainer, name=self.name+"8",
+        _construct_components(self, explainer, self._SPEC,
                 hide_selector=hide_selector, pos_label=pos_label, **kwargs)
         self.cutoffconnector = CutoffConnector(self.cutoffpercentile,
                 [self.summary, self.precision, self.confusionmatrix, self.liftcurve, 
                  self.cumulative_precision, self.classification, self.rocauc, self.prauc])
 
-    def layout(self):
+    def _build_layout(self):
+        cutoffpercentile_layout = self.cutoffpercentile.layout()
+        summary_layout = self.summary.layout()
+        confusionmatrix_layout = self.confusionmatrix.layout()
+        precision_layout = self.precision.layout()
+        classification_layout = self.classification.layout()
+        rocauc_layout = self.rocauc.layout()
+        prauc_layout = self.prauc.layout()
+        liftcurve_layout = self.liftcurve.layout()
+        cumulative_precision_layout = self.cumulative_precision.layout()
         return html.Div([
-            dbc.Row([
+            _row(
                 make_hideable(
                     dbc.Col([
                      html.H2('Model Performance:')]), hide=self.hide_title),
-            ]),
-            dbc.Row([
+            ),
+            _row(
                 make_hideable(
                     dbc.Col([
-                        self.cutoffpercentile.layout(),
+                        cutoffpercentile_layout,
                     ]), hide=self.hide_globalcutoff),
-            ], style=dict(marginTop=25, marginBottom=25)),
+                style=dict(marginTop=25, marginBottom=25)),
             dbc.CardDeck([
-                make_hideable(self.summary.layout(), hide=self.hide_modelsummary),
-                make_hideable(self.confusionmatrix.layout(), hide=self.hide_confusionmatrix),
+                make_hideable(summary_layout, hide=self.hide_modelsummary),
+                make_hideable(confusionmatrix_layout, hide=self.hide_confusionmatrix),
             ], style=dict(marginBottom=25)),
             dbc.CardDeck([
-                make_hideable(self.precision.layout(), hide=self.hide_precision),
-                make_hideable(self.classification.layout(), hide=self.hide_classification)
+                make_hideable(precision_layout, hide=self.hide_precision),
+                make_hideable(classification_layout, hide=self.hide_classification)
             ], style=dict(marginBottom=25)),
             dbc.CardDeck([
-                make_hideable(self.rocauc.layout(), hide=self.hide_rocauc),
-                make_hideable(self.prauc.layout(), hide=self.hide_prauc),
+                make_hideable(rocauc_layout, hide=self.hide_rocauc),
+                make_hideable(prauc_layout, hide=self.hide_prauc),
             ], style=dict(marginBottom=25)),
             dbc.CardDeck([
-                make_hideable(self.liftcurve.layout(), self.hide_liftcurve),
-                make_hideable(self.cumulative_precision.layout(), self.hide_cumprecision),
+                make_hideable(liftcurve_layout, self.hide_liftcurve),
+                make_hideable(cumulative_precision_layout, self.hide_cumprecision),
             ], style=dict(marginBottom=25)),
         ])
 
@@ -204,20 +236,24 @@ class RegressionModelStatsComposite(ExplainerComponent):
         self.reg_vs_col = RegressionVsColComponent(explainer, name=self.name+"2",
                     logs=logs, **kwargs)
 
-    def layout(self):
+    def _build_layout(self):
+        modelsummary_layout = self.modelsummary.layout()
+        preds_vs_actual_layout = self.preds_vs_actual.layout()
+        residuals_layout = self.residuals.layout()
+        reg_vs_col_layout = self.reg_vs_col.layout()
         return html.Div([
-            dbc.Row([
+            _row(
                 make_hideable(
                     dbc.Col([
                         html.H2('Model Performance:')]), hide=self.hide_title)
-            ]),
+            ),
             dbc.CardDeck([
-                make_hideable(self.modelsummary.layout(), hide=self.hide_modelsummary),
-                make_hideable(self.preds_vs_actual.layout(), hide=self.hide_predsvsactual),
+                make_hideable(modelsummary_layout, hide=self.hide_modelsummary),
+                make_hideable(preds_vs_actual_layout, hide=self.hide_predsvsactual),
             ], style=dict(margin=25)),
             dbc.CardDeck([
-                make_hideable(self.residuals.layout(), hide=self.hide_residuals),
-                make_hideable(self.reg_vs_col.layout(), hide=self.hide_regvscol),
+                make_hideable(residuals_layout, hide=self.hide_residuals),
+                make_hideable(reg_vs_col_layout, hide=self.hide_regvscol),
             ], style=dict(margin=25))
         ])
 
@@ -277,19 +313,24 @@ class IndividualPredictionsComposite(ExplainerComponent):
         self.index_connector = IndexConnector(self.index, 
                 [self.summary, self.contributions, self.pdp, self.contributions_list])
 
-    def layout(self):
+    def _build_layout(self):
+        index_layout = self.index.layout()
+        summary_layout = self.summary.layout()
+        contributions_layout = self.contributions.layout()
+        pdp_layout = self.pdp.layout()
+        contributions_list_layout = self.contributions_list.layout()
         return dbc.Container([
                 dbc.CardDeck([
-                    make_hideable(self.index.layout(), hide=self.hide_predindexselector),
-                    make_hideable(self.summary.layout(), hide=self.hide_predictionsummary),
+                    make_hideable(index_layout, hide=self.hide_predindexselector),
+                    make_hideable(summary_layout, hide=self.hide_predictionsummary),
                 ], style=dict(marginBottom=25, marginTop=25)),
                 dbc.CardDeck([
-                    make_hideable(self.contributions.layout(), hide=self.hide_contributiongraph),
-                    make_hideable(self.pdp.layout(), hide=self.hide_pdp),
+                    make_hideable(contributions_layout, hide=self.hide_contributiongraph),
+                    make_hideable(pdp_layout, hide=self.hide_pdp),
                 ], style=dict(marginBottom=25, marginTop=25)),
                 dbc.Row([
                     dbc.Col([
-                        make_hideable(self.contributions_list.layout(), hide=self.hide_contributiontable),
+                        make_hideable(contributions_list_layout, hide=self.hide_contributiontable),
                     ], md=6),
                     dbc.Col([
                         html.Div([]),
@@ -365,35 +406,41 @@ class WhatIfComposite(ExplainerComponent):
 
         self.index_connector = IndexConnector(self.index, [self.input])
 
-    def layout(self):
+    def _build_layout(self):
+        index_layout = self.index.layout()
+        prediction_layout = self.prediction.layout()
+        input_layout = self.input.layout()
+        contribgraph_layout = self.contribgraph.layout()
+        pdp_layout = self.pdp.layout()
+        contribtable_layout = self.contribtable.layout()
         return dbc.Container([
-                dbc.Row([
+                _row(
                     make_hideable(
                         dbc.Col([
                             html.H1(self.title)
                         ]), hide=self.hide_title),
-                ]),
+                ),
                 dbc.Row([
                     make_hideable(
                         dbc.Col([
-                            self.index.layout(), 
+                            index_layout, 
                         ], md=7), hide=self.hide_whatifindexselector),
                     make_hideable(
                         dbc.Col([
-                            self.prediction.layout(),
+                            prediction_layout,
                         ], md=5), hide=self.hide_whatifprediction),
                 ], style=dict(marginBottom=15, marginTop=15)),
                 dbc.CardDeck([
-                    make_hideable(self.input.layout(), hide=self.hide_inputeditor),
+                    make_hideable(input_layout, hide=self.hide_inputeditor),
                 ], style=dict(marginBottom=15, marginTop=15)),
                 dbc.CardDeck([
-                    make_hideable(self.contribgraph.layout(), hide=self.hide_whatifcontributiongraph),
-                    make_hideable(self.pdp.layout(), hide=self.hide_whatifpdp),
+                    make_hideable(contribgraph_layout, hide=self.hide_whatifcontributiongraph),
+                    make_hideable(pdp_layout, hide=self.hide_whatifpdp),
                 ], style=dict(marginBottom=15, marginTop=15)),
                 dbc.Row([
                     make_hideable(
                         dbc.Col([
-                            self.contribtable.layout()
+                            contribtable_layout
                         ], md=6), hide=self.hide_whatifcontributiontable),
                     dbc.Col([], md=6),
                 ])
@@ -434,11 +481,13 @@ class ShapDependenceComposite(ExplainerComponent):
         self.connector = ShapSummaryDependenceConnector(
                     self.shap_summary, self.shap_dependence)
 
-    def layout(self):
+    def _build_layout(self):
+        shap_summary_layout = self.shap_summary.layout()
+        shap_dependence_layout = self.shap_dependence.layout()
         return dbc.Container([
             dbc.CardDeck([
-                make_hideable(self.shap_summary.layout(), hide=self.hide_shapsummary),
-                make_hideable(self.shap_dependence.layout(), hide=self.hide_shapdependence),
+                make_hideable(shap_summary_layout, hide=self.hide_shapsummary),
+                make_hideable(shap_dependence_layout, hide=self.hide_shapdependence),
             ], style=dict(marginTop=25)),
         ], fluid=True)
 
@@ -472,11 +521,13 @@ class ShapInteractionsComposite(ExplainerComponent):
         self.connector = InteractionSummaryDependenceConnector(
             self.interaction_summary, self.interaction_dependence)
         
-    def layout(self):
+    def _build_layout(self):
+        interaction_summary_layout = self.interaction_summary.layout()
+        interaction_dependence_layout = self.interaction_dependence.layout()
         return dbc.Container([
                 dbc.CardDeck([
-                    make_hideable(self.interaction_summary.layout(), hide=self.hide_interactionsummary),
-                    make_hideable(self.interaction_dependence.layout(), hide=self.hide_interactiondependence),
+                    make_hideable(interaction_summary_layout, hide=self.hide_interactionsummary),
+                    make_hideable(interaction_dependence_layout, hide=self.hide_interactiondependence),
                 ], style=dict(marginTop=25))
         ], fluid=True)
 
@@ -530,58 +581,62 @@ class DecisionTreesComposite(ExplainerComponent):
         self.highlight_connector = HighlightConnector(self.trees, 
             [self.decisionpath_table, self.decisionpath_graph])
         
-    def layout(self):
+    def _build_layout(self):
+        index_layout = self.index.layout()
+        trees_layout = self.trees.layout()
+        decisionpath_table_layout = self.decisionpath_table.layout()
+        decisionpath_graph_layout = self.decisionpath_graph.layout()
         if isinstance(self.explainer, XGBExplainer):
             return html.Div([
-                dbc.Row([
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.index.layout(), 
+                            index_layout, 
                         ]), hide=self.hide_treeindexselector),
-                ], style=dict(margin=25)),
+                    style=dict(margin=25)),
                 dbc.Row([
                     make_hideable(
                         dbc.Col([
-                            self.trees.layout(), 
+                            trees_layout, 
                         ], md=8), hide=self.hide_treesgraph),
                     make_hideable(
                         dbc.Col([
-                            self.decisionpath_table.layout(), 
+                            decisionpath_table_layout, 
                         ], md=4), hide=self.hide_treepathtable),
                 ], style=dict(margin=25)),
-                dbc.Row([
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.decisionpath_graph.layout()
+                            decisionpath_graph_layout
                         ]), hide=self.hide_treepathgraph),
-                ], style=dict(margin=25)),
+                    style=dict(margin=25)),
             ])
         elif isinstance(self.explainer, RandomForestExplainer):
             return html.Div([
-                dbc.Row([
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.index.layout(), 
+                            index_layout, 
                         ]), hide=self.hide_treeindexselector),
-                ], style=dict(margin=25)),
-                dbc.Row([
+                    style=dict(margin=25)),
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.trees.layout(), 
+                            trees_layout, 
                         ]), hide=self.hide_treesgraph),
-                ], style=dict(margin=25)),
-                dbc.Row([
+                    style=dict(margin=25)),
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.decisionpath_table.layout(), 
+                            decisionpath_table_layout, 
                         ]), hide=self.hide_treepathtable),
-                ], style=dict(margin=25)),
-                dbc.Row([
+                    style=dict(margin=25)),
+                _row(
                     make_hideable(
                         dbc.Col([
-                            self.decisionpath_graph.layout()
+                            decisionpath_graph_layout
                         ]), hide=self.hide_treepathgraph),
-                ], style=dict(margin=25)),
+                    style=dict(margin=25)),
             ])
         else:
             raise ValueError("explainer is neither a RandomForestExplainer nor an XGBExplainer! "
@@ -11,6 +11,10 @@ __all__ = [
 ]
 
 import sys
+import os
+import logging
+import functools
+import itertools
 from abc import ABC
 import inspect
 import types
@@ -22,6 +26,33 @@ import dash_html_components as html
 
 import shortuuid
 
+_log = logging.getLogger(__name__)
+
+# counter used to generate cheap unique component names: names only need
+# to be unique within a single process, so there is no need to generate
+# a full random uuid for every component. Set EXPLAINERDASHBOARD_UUID_NAMES
+# to still get random shortuuid names instead. Generated names end in an
+# underscore so that they can never collide with the derived names that
+# composites give their subcomponents by appending digits to their own name
+# (e.g. "c10" vs "c1"+"0").
+_name_counter = itertools.count()
+
+# cache the Signature objects of delegate targets: the same base __init__ or
+# component class gets inspected for every subclass (or every delegating
+# method) at class-definition time. Note that the signature of the *decorated*
+# function itself always needs to be read fresh, since delegates_kwargs
+# replaces its __signature__.
+_signature = functools.lru_cache(maxsize=None)(inspect.signature)
+
+@functools.lru_cache(maxsize=None)
+def _default_params(fn):
+    """returns the parameters of fn that have a default value, keyed by name.
+    Cached because inspect.signature() is slow and the same base __init__
+    gets inspected for every subclass at class-definition time."""
+    return {k: v for k, v in _signature(fn).parameters.items()
+                if v.default != inspect.Parameter.empty}
+
+
 # Stolen from https://www.fast.ai/2019/08/06/delegation/
 # then extended to deal with multiple inheritance
 def delegates_kwargs(to=None, keep=False):
@@ -34,13 +65,13 @@ def delegates_kwargs(to=None, keep=False):
         if to is None:
             for base_cls in f.__bases__:
                 to_f = base_cls.__init__
-                s2 = {k: v for k, v in inspect.signature(to_f).parameters.items()
-                    if v.default != inspect.Parameter.empty and k not in sigd}
+                s2 = {k: v for k, v in _default_params(to_f).items()
+                    if k not in sigd}
                 sigd.update(s2)
         else:
             to_f = to
-            s2 = {k: v for k, v in inspect.signature(to_f).parameters.items()
-                if v.default != inspect.Parameter.empty and k not in sigd}
+            s2 = {k: v for k, v in _default_params(to_f).items()
+                if k not in sigd}
             sigd.update(s2)
         if keep: 
             sigd['kwargs'] = k
@@ -114,17 +145,33 @@ def make_hideable(element, hide=False):
         make_hideable(dbc.Col([cutoff.layout()]), hide=hide_cutoff)
 
     Args:
-        hide(bool): wrap the element inside a hidden html.div. If the element 
+        hide(bool): wrap the element inside a hidden html.div. If the element
                     is a dbc.Col or a dbc.FormGroup, wrap element.children in
                     a hidden html.Div instead. Defaults to False.
-    """ 
-    if hide:
-        if isinstance(element, dbc.Col) or isinstance(element, dbc.FormGroup):
-            return html.Div(element.children, style=dict(display="none"))
-        else:
-            return html.Div(element, style=dict(display="none"))
-    else:
+
+    Note that hidden elements still get wrapped in a display:none Div rather
+    than dropped from the layout altogether: their element ids need to stay
+    in the DOM because registered callbacks may still target them (e.g. a
+    hidden cutoff slider that other components connect to).
+    """
+    if not hide:
         return element
+    if isinstance(element, (dbc.Col, dbc.FormGroup)):
+        return html.Div(element.children, style=dict(display="none"))
+    return html.Div(element, style=dict(display="none"))
+
+_pos_label_connector_class = None
+
+def _get_pos_label_connector_class():
+    """returns the PosLabelConnector class. Imported lazily and cached, since
+    dashboard_components imports from this module, so a top-level import
+    would be circular."""
+    global _pos_label_connector_class
+    if _pos_label_connector_class is None:
+        from .dashboard_components.connectors import PosLabelConnector
+        _pos_label_connector_class = PosLabelConnector
+    return _pos_label_connector_class
+
 
 class DummyComponent:
     def __init__(self):
@@ -175,10 +222,34 @@ class ExplainerComponent(ABC):
         self._store_child_params(no_param=['explainer'])
 
         if self.name is None:
-            self.name = shortuuid.ShortUUID().random(length=5)
+            if os.environ.get("EXPLAINERDASHBOARD_UUID_NAMES"):
+                self.name = shortuuid.ShortUUID().random(length=5)
+            else:
+                self.name = f"c{next(_name_counter):x}_"
 
         self._components = []
+        self._exclude_components = []
         self._dependencies = []
+        self._layout_cache = None
+        self._deps_cache = None
+        self._pos_labels_cache = None
+
+    def __getattr__(self, attr):
+        # some components (e.g. the connector components) do not call
+        # ExplainerComponent.__init__, and components pickled by older
+        # versions may lack attributes that __init__ now sets. Initialize
+        # those attributes lazily here, so the methods that use them don't
+        # need hasattr guards. Only gets called when an attribute is missing,
+        # so this costs nothing when __init__ did run.
+        if attr in ('_components', '_exclude_components', '_dependencies'):
+            value = []
+        elif attr in ('_layout_cache', '_deps_cache', '_pos_labels_cache'):
+            value = None
+        else:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{attr}'")
+        setattr(self, attr, value)
+        return value
 
     def _store_child_params(self, no_store=None, no_attr=None, no_param=None):
              
@@ -212,8 +283,6 @@ class ExplainerComponent(ABC):
     def exclude_callbacks(self, *components):
         """exclude certain subcomponents from the register_components scan
         """
-        if not hasattr(self, '_exclude_components'):
-            self._exclude_components = []
         for comp in components:
             if isinstance(comp, ExplainerComponent) and comp not in self._exclude_components:
                 self._exclude_components.append(comp)
@@ -226,38 +295,39 @@ class ExplainerComponent(ABC):
             scan_self (bool, optional): scan self.__dict__ and add all
             ExplainerComponent attributes to _components. Defaults to True
         """
-        if not hasattr(self, '_components'):
-            self._components = []
-        if not hasattr(self, '_exclude_components'):
-            self._exclude_components = []
+        _EC = ExplainerComponent
         for comp in components:
-            if (isinstance(comp, ExplainerComponent) 
-                and comp not in self._components
-                and comp not in self._exclude_components):
-                self._components.append(comp)
-            elif hasattr(comp, '__iter__'):
-                for subcomp in comp:
-                    if (isinstance(subcomp, ExplainerComponent) 
-                        and subcomp not in self._components
-                        and subcomp not in self._exclude_components):
-                        self._components.append(subcomp)
-                    else:
-                        print(f"{subcomp.__name__} is not an ExplainerComponent so not adding to self.components")
-            else:
-                print(f"{comp.__name__} is not an ExplainerComponent so not adding to self.components")
-        
+            if isinstance(comp, _EC):
+                if (comp not in self._components
+                    and comp not in self._exclude_components):
+                    self._components.append(comp)
+                continue
+            try:
+                subcomps = iter(comp)
+            except TypeError:
+                _log.warning("%s is not an ExplainerComponent so not adding to self.components",
+                    getattr(comp, '__name__', type(comp).__name__))
+                continue
+            for subcomp in subcomps:
+                if (isinstance(subcomp, _EC)
+                    and subcomp not in self._components
+                    and subcomp not in self._exclude_components):
+                    self._components.append(subcomp)
+                else:
+                    _log.warning("%s is not an ExplainerComponent so not adding to self.components",
+                        getattr(subcomp, '__name__', type(subcomp).__name__))
+
         for k, v in self.__dict__.items():
-            if (k != '_components' 
-                and isinstance(v, ExplainerComponent) 
+            if (k != '_components'
+                and isinstance(v, _EC)
                 and v not in self._components
                 and v not in self._exclude_components):
                 self._components.append(v)
 
     def has_pos_label_connector(self):
-        if not hasattr(self, '_components'):
-            self._components = []
+        PosLabelConnector = _get_pos_label_connector_class()
         for comp in self._components:
-            if str(type(comp)).endswith("PosLabelConnector'>"):
+            if isinstance(comp, PosLabelConnector):
                 return True
             elif comp.has_pos_label_connector():
                 return True
@@ -274,22 +344,28 @@ class ExplainerComponent(ABC):
                     if isinstance(subdep, str):
                         self._dependencies.append(subdep)
                     else:
-                        print(f"{subdep.__name__} is not a str so not adding to self.dependencies")
+                        _log.warning("%s is not a str so not adding to self.dependencies",
+                            getattr(subdep, '__name__', type(subdep).__name__))
             else:
-                print(f"{dep.__name__} is not a str or list of str so not adding to self.dependencies")
+                _log.warning("%s is not a str or list of str so not adding to self.dependencies",
+                    getattr(dep, '__name__', type(dep).__name__))
+
+    def _dependencies_set(self):
+        """returns the unique dependencies of the component and all
+        subcomponents as a frozenset, built and cached on the first call"""
+        if self._deps_cache is None:
+            self.register_components()
+            deps = set(self._dependencies)
+            for comp in self._components:
+                deps.update(comp._dependencies_set())
+            self._deps_cache = frozenset(deps)
+        return self._deps_cache
 
     @property
     def dependencies(self):
-        """returns a list of unique dependencies of the component 
+        """returns a list of unique dependencies of the component
         and all subcomponents"""
-        if not hasattr(self, '_dependencies'):
-            self._dependencies = []
-        self.register_components()
-        deps = self._dependencies
-        for comp in self._components:
-            deps.extend(comp.dependencies)
-        deps = list(set(deps))
-        return deps
+        return list(self._dependencies_set())
 
     @property
     def component_imports(self):
@@ -307,34 +383,54 @@ class ExplainerComponent(ABC):
         """returns a list of unique pos label selector elements 
         of the component and all subcomponents"""
         
-        self.register_components()
-        pos_labels = []
-        for k, v in self.__dict__.items():
-            if isinstance(v, PosLabelSelector) and v.name not in pos_labels:
-                pos_labels.append('pos-label-'+v.name)
-        # if hasattr(self, 'selector') and isinstance(self.selector, PosLabelSelector):
-        #     pos_labels.append('pos-label-'+self.selector.name)
-        for comp in self._components:
-            pos_labels.extend(comp.pos_labels)
-        pos_labels = list(set(pos_labels))
-        return pos_labels
+        if self._pos_labels_cache is None:
+            self.register_components()
+            pos_labels = []
+            for k, v in self.__dict__.items():
+                if isinstance(v, PosLabelSelector) and v.name not in pos_labels:
+                    pos_labels.append('pos-label-'+v.name)
+            # if hasattr(self, 'selector') and isinstance(self.selector, PosLabelSelector):
+            #     pos_labels.append('pos-label-'+self.selector.name)
+            for comp in self._components:
+                pos_labels.extend(comp.pos_labels)
+            self._pos_labels_cache = list(set(pos_labels))
+        return self._pos_labels_cache
+
+    # base explainer properties that other dependencies build on top of:
+    # calculating these first means dependent properties find them already
+    # cached instead of triggering them halfway through their own calculation.
+    _dependency_order = ['preds', 'pred_probas', 'pred_percentiles',
+                        'shap_values', 'shap_values_cats',
+                        'shap_interaction_values', 'shap_interaction_values_cats']
 
     def calculate_dependencies(self):
         """calls all properties in self.dependencies so that they get calculated
         up front. This is useful to do before starting a dashboard, so you don't
         compute properties multiple times in parallel."""
-        for dep in self.dependencies:
+        order = self._dependency_order
+        deps = sorted(self.dependencies,
+                    key=lambda dep: order.index(dep) if dep in order else len(order))
+        for dep in deps:
             try:
                 _ = getattr(self.explainer, dep)
-            except:
-                ValueError(f"Failed to generate dependency '{dep}': "
-                    "Failed to calculate or retrieve explainer property explainer.{dep}...")
+            except Exception as e:
+                raise ValueError(f"Failed to calculate or retrieve "
+                    f"explainer property explainer.{dep}...") from e
 
-    def layout(self):
+    def _build_layout(self):
         """layout to be defined by the particular ExplainerComponent instance.
         All element id's should append +self.name to make sure they are unique."""
         return None
 
+    def layout(self):
+        """returns the layout of the component: builds it with _build_layout()
+        on the first call and returns the cached result on subsequent calls.
+        The layout of a component is static for the lifetime of the component,
+        so there is no need to rebuild the whole component tree on every call."""
+        if self._layout_cache is None:
+            self._layout_cache = self._build_layout()
+        return self._layout_cache
+
     def component_callbacks(self, app):
         """register callbacks specific to this ExplainerComponent."""
         if hasattr(self, "_register_callbacks"):
@@ -345,11 +441,35 @@ class ExplainerComponent(ABC):
     def register_callbacks(self, app):
         """First register callbacks of all subcomponents, then call
         component_callbacks(app)
+
+        Traverses the component tree iteratively instead of recursing,
+        and registers each component only once, even when it is a
+        subcomponent of multiple parents.
         """
-        self.register_components()
-        for comp in self._components:
-            comp.register_callbacks(app)
-        self.component_callbacks(app)
+        base_register = ExplainerComponent.register_callbacks
+        stack = [self]
+        order = []
+        seen = set()
+        while stack:
+            comp = stack.pop()
+            if id(comp) in seen:
+                continue
+            seen.add(id(comp))
+            if comp is not self and type(comp).register_callbacks is not base_register:
+                # component brings its own register_callbacks() implementation,
+                # so let it handle its own subcomponents
+                order.append((comp, True))
+                continue
+            comp.register_components()
+            order.append((comp, False))
+            stack.extend(comp._components)
+        # reversed pop-order registers subcomponents before their parents,
+        # like the old recursive post-order traversal did
+        for comp, has_own_register in reversed(order):
+            if has_own_register:
+                comp.register_callbacks(app)
+            else:
+                comp.component_callbacks(app)
 
 
 class PosLabelSelector(ExplainerComponent):
@@ -375,22 +495,32 @@ class PosLabelSelector(ExplainerComponent):
             self.pos_label = explainer.get_pos_label_index(pos_label)
         else:
             self.pos_label = explainer.pos_label
+        # explainer.labels is invariant for the lifetime of the explainer,
+        # so the dropdown options (or the hidden dummy input for regression
+        # models) can be built once up front instead of on every layout() call.
+        if explainer.is_classifier:
+            self._options = [{'label': label, 'value': i}
+                                for i, label in enumerate(explainer.labels)]
+            self._hidden_input = None
+        else:
+            self._options = None
+            self._hidden_input = html.Div([dcc.Input(id="pos-label-"+self.name)],
+                                    style=dict(display="none"))
 
     def layout(self):
         if self.explainer.is_classifier:
             return html.Div([
-                    dbc.Label("Positive class:", 
-                        html_for="pos-label-"+self.name, 
+                    dbc.Label("Positive class:",
+                        html_for="pos-label-"+self.name,
                         id="pos-label-label-"+self.name),
                     dbc.Tooltip("Select the label to be set as the positive class",
                         target="pos-label-label-"+self.name),
                     dcc.Dropdown(
                         id='pos-label-'+self.name,
-                        options = [{'label': label, 'value': i}
-                                for i, label in enumerate(self.explainer.labels)],
+                        options=self._options,
                         value = self.pos_label,
                         clearable=False,
                         )
             ])
         else:
-            return html.Div([dcc.Input(id="pos-label-"+self.name)], style=dict(display="none"))
\ No newline at end of file
+            return self._hidden_input
\ No newline at end of file
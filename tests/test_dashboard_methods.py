@@ -0,0 +1,33 @@
+import unittest
+
+from explainerdashboard.dashboard_methods import ExplainerComponent
+
+
+class _ChildComponent(ExplainerComponent):
+    def __init__(self, explainer, title=None, name=None):
+        super().__init__(explainer, title, name)
+
+
+class _ParentComponent(ExplainerComponent):
+    """builds subcomponents with derived names the way composites do:
+    by appending digits to its own name"""
+    def __init__(self, explainer, title=None, name=None):
+        super().__init__(explainer, title, name)
+        self.child0 = _ChildComponent(explainer, name=self.name+"0")
+        self.child1 = _ChildComponent(explainer, name=self.name+"1")
+
+
+class GeneratedNamesTests(unittest.TestCase):
+    def test_generated_names_unique(self):
+        # generated names should never collide with derived subcomponent
+        # names: e.g. with plain hex counter names the 17th component "c10"
+        # would clash with the first child "c1"+"0" of the second component
+        parents = [_ParentComponent(None) for _ in range(20)]
+        names = [parent.name for parent in parents]
+        names.extend(parent.child0.name for parent in parents)
+        names.extend(parent.child1.name for parent in parents)
+        self.assertEqual(len(names), len(set(names)))
+
+
+if __name__ == '__main__':
+    unittest.main()